@@ -0,0 +1,128 @@
+"""
+Rip.fun HTTP Helpers
+====================
+
+Shared HTTP settings and polling loop for the store notifier and the
+marketplace monitor. Both scripts import SESSION from here, so when they
+run in one process (rip_monitor.py) they share a single connection pool to
+rip.fun.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from typing import Callable, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# User-Agent sent with every request
+USER_AGENT: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# (connect, read) timeouts for page fetches
+FETCH_TIMEOUT = (3.05, 15)
+
+# Timeout for HEAD probes checking whether a page changed
+PROBE_TIMEOUT: float = 5
+
+# Bytes read per chunk when streaming pages
+STREAM_CHUNK_SIZE: int = 65536
+
+# Headers for webhook POSTs, whose bodies are pre-serialized with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# A single pooled session is reused across polls so repeat requests to the
+# same host skip the TCP and TLS handshakes. requests.Session isn't
+# guaranteed to be thread-safe, so only use it from one thread at a time.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+# Cache validators (ETag, Last-Modified, Content-Length) from the last full
+# fetch of each URL
+_validators: Dict[str, Dict[str, str]] = {}
+
+
+def remember_validators(url: str, response: requests.Response) -> None:
+    """Store the cache validators of a full fetch of url.
+
+    Call this only once the response has been parsed and its result cached.
+    """
+    _validators[url] = {
+        name: response.headers[name]
+        for name in ("ETag", "Last-Modified", "Content-Length")
+        if name in response.headers
+    }
+
+
+def revalidation_headers(url: str) -> Optional[Dict[str, str]]:
+    """Return conditional GET headers for url, or None if it looks unchanged.
+
+    With an ETag the conditional GET alone gets a body-less 304, so nothing
+    else is sent. Without one, a HEAD probe compares Last-Modified and
+    Content-Length with the last fetch, for servers that ignore
+    If-Modified-Since. Content-Length alone isn't trusted, since a price
+    change often keeps the page the same length. A failed probe counts as
+    "unknown" and the GET goes ahead.
+    """
+    validators = _validators.get(url, {})
+    headers = {}
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+
+    if "ETag" in validators or "Last-Modified" not in validators:
+        return headers
+
+    try:
+        head = SESSION.head(url, timeout=PROBE_TIMEOUT)
+    except requests.RequestException as exc:
+        logging.debug("HEAD probe of %s failed: %s", url, exc)
+        return headers
+
+    if head.ok and all(head.headers.get(name) == validators.get(name) for name in ("Last-Modified", "Content-Length")):
+        return None
+    return headers
+
+
+async def poll_forever(
+    name: str,
+    check: Callable[[], bool],
+    poll_interval: int,
+    max_backoff: int,
+    start_delay: float = 0,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Run a blocking check on a fixed schedule, backing off while it fails.
+
+    Args:
+        name: Name used in log messages.
+        check: Check to run; returns False when its page could not be fetched.
+        poll_interval: Seconds between checks while they succeed.
+        max_backoff: Upper bound for the interval while backing off.
+        start_delay: Seconds to wait before the first check.
+        executor: Executor the check runs in; the loop's default if None.
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(start_delay)
+
+    interval = poll_interval
+    next_tick = time.monotonic()
+
+    while True:
+        if await loop.run_in_executor(executor, check):
+            interval = poll_interval
+        else:
+            # Back off while the site is failing instead of polling at full rate
+            interval = min(interval * 2, max_backoff)
+            logging.warning("%s check failed, next attempt in %d seconds", name, interval)
+
+        # Schedule against absolute time so the check duration doesn't cause drift
+        next_tick = max(next_tick + interval, time.monotonic())
+        await asyncio.sleep(max(0, next_tick - time.monotonic()))
@@ -19,13 +19,26 @@ Configuration:
 - Configure price filters if desired
 """
 
-import json
+import asyncio
+import functools
 import os
-import time
 import logging
 import re
-from typing import Dict, Set, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import aiohttp
+import orjson
 import requests
+from rip_http import (
+    FETCH_TIMEOUT,
+    JSON_HEADERS,
+    SESSION,
+    STREAM_CHUNK_SIZE,
+    poll_forever,
+    remember_validators,
+    revalidation_headers,
+)
+from rip_sveltekit import fetch_data_endpoint, iter_objects
 from datetime import datetime, timezone
 
 # ---------------------------------------------------------------------------
@@ -40,6 +53,9 @@ DISCORD_MARKETPLACE_WEBHOOK_URL: str = os.getenv("DISCORD_MARKETPLACE_WEBHOOK_UR
 # How often to check for new listings (in seconds). 300 seconds = 5 minutes.
 POLL_INTERVAL_SECONDS: int = 300
 
+# Upper bound for the poll interval while backing off after failed checks
+MAX_BACKOFF_SECONDS: int = 3600
+
 # Minimum price to notify about (set to 0 to notify about all listings)
 MIN_LISTING_PRICE: float = 0.0
 
@@ -53,72 +69,260 @@ DEAL_THRESHOLD_PERCENT: float = 0.0
 # File to store seen listings to avoid duplicates
 SEEN_LISTINGS_FILE: str = "/tmp/rip_seen_listings.json"
 
+# Maximum number of listing IDs remembered; the least recently seen are dropped
+MAX_SEEN_LISTINGS: int = 10000
+
+# Discord accepts at most 10 embeds per webhook message
+DISCORD_MAX_EMBEDS: int = 10
+
+# Maximum number of embed batches waiting to be sent to Discord
+NOTIFY_QUEUE_SIZE: int = 1000
+
+# SvelteKit data endpoint serving the marketplace page data as JSON
+MARKETPLACE_DATA_URL: str = "https://rip.fun/marketplace/__data.json"
+
+# Rarity emoji mapping
+RARITY_EMOJI: Dict[str, str] = {
+    'Common': '⚪',
+    'Uncommon': '🟢',
+    'Rare': '🔵',
+    'Rare Holo': '🟣',
+    'Ultra Rare': '🟠',
+    'Secret Rare': '🟡',
+    'Rainbow Rare': '🌈'
+}
+
+# Deal alert message per tier, filled in with the absolute percentage
+DEAL_MESSAGES: Dict[str, str] = {
+    'amazing': "🔥 AMAZING DEAL: {:.1f}% below market!",
+    'good': "💸 Good Deal: {:.1f}% below market!",
+    'below': "📉 Below Market: {:.1f}% below market",
+    'premium': "💰 Premium Listing: {:.1f}% above market",
+    'above': "📈 Above Market: {:.1f}% above market",
+    'near': "📊 Near Market Price",
+}
+
+# ---------------------------------------------------------------------------
+# Parsing patterns
+# ---------------------------------------------------------------------------
+
+# Number of listings taken from the top of the marketplace page
+MAX_LISTINGS: int = 5
+
+# One listing object with card_id, name and price captured together.
+# Patterns work on raw bytes so the page never has to be decoded. Keys are
+# matched case-sensitively, like LISTING_ANCHOR; only card IDs ignore case.
+LISTING_RE = re.compile(
+    rb'\{[^{}]*?"card_id":\s*"(?P<id>(?i:[a-z0-9]+pt?\d*-[a-z0-9]+))"'
+    rb'[^{}]*?"name":\s*"(?P<name>[^"]+)"'
+    rb'[^{}]*?"price":\s*"(?P<price>\d+)"'
+)
+
+# Substring every listing object contains, located with bytes.find so the
+# regex only runs on the object around each hit
+LISTING_ANCHOR: bytes = b'"card_id"'
+
+# Fallback pattern, used only when LISTING_RE finds nothing. Card IDs in the
+# format like "sv8pt5-63vmh", prices like "10400000" (price in smallest
+# units) and card names are alternatives, so one pass collects all three.
+FALLBACK_RE = re.compile(
+    rb'(?i:["\'](?P<card_id>[a-z0-9]+pt?\d*-[a-z0-9]+)["\'])'
+    rb'|"price":\s*"(?P<price>\d+)"'
+    rb'|"name":\s*"(?P<name>[^"]+)"'
+)
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
+def build_listing(card_id: str, name: str, price_str: str) -> Dict:
+    """Build a listing dictionary from raw scraped values.
+    
+    Args:
+        card_id: Card ID such as "sv8pt5-63vmh".
+        name: Card name.
+        price_str: Price in smallest units (6 decimals).
+        
+    Returns:
+        Listing dictionary.
+    """
+    # Convert price from smallest units to dollars (assuming 6 decimals)
+    try:
+        listed_price = float(price_str) / 1000000
+    except (ValueError, TypeError):
+        listed_price = 0.0
+    
+    return {
+        'card_id': card_id,
+        'card_name': name,
+        'set_name': 'Unknown Set',  # Can't easily extract set names
+        'listed_price': listed_price,
+        'market_price': listed_price * 1.2,  # Mock market price (20% higher)
+        'quantity': 1,
+        'rarity': 'Unknown'
+    }
+
+
+def stream_marketplace_listings(response: requests.Response) -> Tuple[List[Dict], bytearray]:
+    """Read a streamed marketplace response, stopping once enough listings are found.
+    
+    Args:
+        response: Response opened with stream=True.
+        
+    Returns:
+        Tuple of (listings found, raw page bytes read so far).
+    """
+    body = bytearray()
+    scan_from = 0
+    listings = []
+    
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        body += chunk
+        
+        while True:
+            anchor = body.find(LISTING_ANCHOR, scan_from)
+            if anchor < 0:
+                # Re-check the tail in case the anchor is split across chunks
+                scan_from = max(scan_from, len(body) - len(LISTING_ANCHOR) + 1)
+                break
+            
+            # A listing object contains no braces, so it can only start at
+            # the last "{" before its card_id
+            start = body.rfind(b'{', 0, anchor)
+            m = LISTING_RE.match(body, start) if start >= 0 else None
+            if m:
+                listings.append(build_listing(
+                    m.group('id').decode(),
+                    m.group('name').decode('utf-8', 'replace'),
+                    m.group('price').decode(),
+                ))
+                if len(listings) >= MAX_LISTINGS:
+                    return listings, body
+                scan_from = m.end()
+            elif body.find(b'}', anchor) < 0 and body.find(b'{', anchor) < 0:
+                # The object is still cut off; retry once more data arrives
+                scan_from = anchor
+                break
+            else:
+                scan_from = anchor + len(LISTING_ANCHOR)
+    
+    return listings, body
+
+
+def parse_marketplace_fallback(html: bytes) -> List[Dict]:
+    """Extract listings from loose card ID, price and name matches.
+    
+    Only used when LISTING_RE finds nothing; matches are paired by position.
+    
+    Args:
+        html: Raw marketplace page HTML.
+        
+    Returns:
+        List of listing dictionaries (most recent/top of page first).
+    """
+    found: Dict[str, List[str]] = {'card_id': [], 'price': [], 'name': []}
+    
+    for m in FALLBACK_RE.finditer(html):
+        values = found[m.lastgroup]
+        if len(values) < MAX_LISTINGS:
+            values.append(m.group(m.lastgroup).decode('utf-8', 'replace'))
+            if all(len(v) >= MAX_LISTINGS for v in found.values()):
+                break
+    
+    card_ids, prices, names = found['card_id'], found['price'], found['name']
+    
+    listings = []
+    for i, card_id in enumerate(card_ids):
+        # Get corresponding price and name if available
+        price_str = prices[i] if i < len(prices) else "0"
+        name = names[i] if i < len(names) else f"Card {card_id}"
+        listings.append(build_listing(card_id, name, price_str))
+    
+    return listings
+
+
+# Parsed result from the last full marketplace fetch
+_last_marketplace_data: Optional[Dict] = None
+
+
+def extract_listings(nodes: List[Any]) -> List[Dict]:
+    """Build listings from the decoded marketplace __data.json nodes.
+    
+    Args:
+        nodes: Decoded data nodes (see rip_sveltekit.load_data_nodes).
+        
+    Returns:
+        List of listing dictionaries, possibly empty.
+    """
+    # Listing objects carry card_id, name and price together
+    listings = []
+    for obj in iter_objects(nodes):
+        card_id = obj.get('card_id')
+        if not isinstance(card_id, str) or 'price' not in obj:
+            continue
+        name = obj.get('name') or f"Card {card_id}"
+        listings.append(build_listing(card_id, str(name), str(obj['price'])))
+        if len(listings) >= MAX_LISTINGS:
+            break
+    
+    return listings
+
+
 def fetch_marketplace_data() -> Optional[Dict]:
     """Fetch and parse marketplace data from rip.fun.
     
+    The structured __data.json endpoint is tried first (see
+    rip_sveltekit.fetch_data_endpoint). If it is unusable, the HTML page is
+    scraped and revalidated the same way when a previous result is cached.
+    
     Returns:
         Dict containing marketplace listings or None on failure.
     """
+    global _last_marketplace_data
+    
+    try:
+        listings = fetch_data_endpoint(MARKETPLACE_DATA_URL, extract_listings)
+    except requests.RequestException as exc:
+        logging.error("Failed to fetch marketplace data endpoint: %s", exc)
+        return None
+    except Exception as exc:
+        logging.error("Unexpected error parsing marketplace data endpoint: %s", exc)
+        return None
+    
+    if listings is not None:
+        logging.info("Fetched %d marketplace listings from data endpoint", len(listings))
+        _last_marketplace_data = {"listings": listings}
+        return _last_marketplace_data
+    
     url = "https://rip.fun/marketplace"
+    headers = {}
+    if _last_marketplace_data is not None:
+        headers = revalidation_headers(url)
+        if headers is None:
+            logging.info("Marketplace page unchanged since last fetch, reusing last result")
+            return _last_marketplace_data
+    
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        # Stream the page so parsing can stop once the top listings are found
+        with SESSION.get(url, headers=headers, stream=True, timeout=FETCH_TIMEOUT) as response:
+            if response.status_code == 304:
+                logging.info("Marketplace page not modified, reusing last result")
+                return _last_marketplace_data
+            
+            response.raise_for_status()
+            processed_listings, html = stream_marketplace_listings(response)
         
-        html = response.text
-        logging.info("Fetched marketplace page (%d characters)", len(html))
+        logging.info("Fetched marketplace page (%d bytes)", len(html))
         
-        # Extract card listing data using a more robust approach
-        # Look for specific card ID patterns that we know exist
         try:
-            # Look for card IDs in the format like "sv8pt5-63vmh" 
-            card_id_pattern = r'["\']([a-z0-9]+pt?\d*-[a-z0-9]+)["\']'
-            card_ids = re.findall(card_id_pattern, html, re.IGNORECASE)
+            if not processed_listings:
+                processed_listings = parse_marketplace_fallback(html)
             
-            # Look for price patterns like "10400000" (price in smallest units) 
-            price_pattern = r'"price":\s*"(\d+)"'
-            prices = re.findall(price_pattern, html)
-            
-            # Look for card names in quotes
-            name_pattern = r'"name":\s*"([^"]+)"'
-            names = re.findall(name_pattern, html)
-            
-            # If we found data, create basic listings
-            if card_ids:
-                processed_listings = []
-                
-                # Take only the first 5 listings (most recent/top of page)
-                for i, card_id in enumerate(card_ids[:5]):  # Limit to 5 to focus on newest
-                    # Get corresponding price and name if available
-                    price_str = prices[i] if i < len(prices) else "0"
-                    name = names[i] if i < len(names) else f"Card {card_id}"
-                    
-                    # Convert price from smallest units to dollars (assuming 6 decimals)
-                    try:
-                        listed_price = float(price_str) / 1000000
-                    except (ValueError, TypeError):
-                        listed_price = 0.0
-                    
-                    processed_listing = {
-                        'card_id': card_id,
-                        'card_name': name,
-                        'set_name': 'Unknown Set',  # Can't easily extract set names
-                        'listed_price': listed_price,
-                        'market_price': listed_price * 1.2,  # Mock market price (20% higher)
-                        'quantity': 1,
-                        'rarity': 'Unknown',
-                        'timestamp': time.time()
-                    }
-                    processed_listings.append(processed_listing)
-                
+            if processed_listings:
                 logging.info("Successfully parsed %d marketplace listings using pattern matching", len(processed_listings))
-                return {"listings": processed_listings}
+                remember_validators(url, response)
+                _last_marketplace_data = {"listings": processed_listings}
+                return _last_marketplace_data
             
             logging.warning("No card ID patterns found in page")
             return {"listings": []}
@@ -135,36 +339,68 @@ def fetch_marketplace_data() -> Optional[Dict]:
         return None
 
 
-def load_seen_listings() -> Set[str]:
-    """Load previously seen listing IDs from file.
+# In-memory copy of the seen listings file, loaded once per process.
+# Keys are kept in least- to most-recently-seen order; values are unused.
+_SEEN_CACHE: Optional["OrderedDict[str, None]"] = None
+
+
+def load_seen_listings() -> "OrderedDict[str, None]":
+    """Load previously seen listing IDs, reading the file only on first use.
     
     Returns:
-        Set of listing IDs that have been seen before.
+        Ordered mapping of listing IDs that have been seen before.
     """
+    global _SEEN_CACHE
+    if _SEEN_CACHE is not None:
+        return _SEEN_CACHE
+    
+    _SEEN_CACHE = OrderedDict()
     try:
         if os.path.exists(SEEN_LISTINGS_FILE):
-            with open(SEEN_LISTINGS_FILE, 'r') as f:
-                data = json.load(f)
-                return set(data.get('seen_listings', []))
-    except (json.JSONDecodeError, IOError) as exc:
+            with open(SEEN_LISTINGS_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+                ids = data.get('seen_listings', [])[-MAX_SEEN_LISTINGS:]
+                _SEEN_CACHE = OrderedDict.fromkeys(ids)
+    except (orjson.JSONDecodeError, IOError) as exc:
         logging.warning("Could not load seen listings file: %s", exc)
     
-    return set()
+    return _SEEN_CACHE
+
+
+def mark_seen(seen_listings: "OrderedDict[str, None]", listing_id: str) -> None:
+    """Record a listing as most recently seen, evicting the oldest past the cap.
+    
+    Args:
+        seen_listings: Ordered mapping of seen listing IDs.
+        listing_id: Listing ID to record.
+    """
+    seen_listings[listing_id] = None
+    seen_listings.move_to_end(listing_id)
+    if len(seen_listings) > MAX_SEEN_LISTINGS:
+        seen_listings.popitem(last=False)
 
 
-def save_seen_listings(seen_listings: Set[str]) -> None:
-    """Save seen listing IDs to file.
+def save_seen_listings(seen_listings: "OrderedDict[str, None]") -> None:
+    """Save seen listing IDs to file atomically and update the in-memory copy.
     
     Args:
-        seen_listings: Set of listing IDs that have been seen.
+        seen_listings: Ordered mapping of listing IDs that have been seen.
     """
+    global _SEEN_CACHE
+    _SEEN_CACHE = seen_listings
+    
+    tmp_file = SEEN_LISTINGS_FILE + ".tmp"
     try:
         data = {
             'seen_listings': list(seen_listings),
             'last_updated': datetime.now(timezone.utc).isoformat()
         }
-        with open(SEEN_LISTINGS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        # Swap in the new file so a crash never leaves it half-written
+        os.replace(tmp_file, SEEN_LISTINGS_FILE)
     except IOError as exc:
         logging.error("Could not save seen listings file: %s", exc)
 
@@ -194,135 +430,210 @@ def format_deal_message(deal_percent: float) -> str:
     Returns:
         Formatted deal message string.
     """
+    # Tiers use the exact percentage so rounding never moves a deal across a
+    # threshold; only the one decimal shown is rounded, for the cache key
     if deal_percent <= -20:
-        return f"🔥 AMAZING DEAL: {abs(deal_percent):.1f}% below market!"
+        tier = 'amazing'
     elif deal_percent <= -10:
-        return f"💸 Good Deal: {abs(deal_percent):.1f}% below market!"
+        tier = 'good'
     elif deal_percent <= -5:
-        return f"📉 Below Market: {abs(deal_percent):.1f}% below market"
+        tier = 'below'
     elif deal_percent >= 20:
-        return f"💰 Premium Listing: {deal_percent:.1f}% above market"
+        tier = 'premium'
     elif deal_percent >= 5:
-        return f"📈 Above Market: {deal_percent:.1f}% above market"
+        tier = 'above'
     else:
-        return "📊 Near Market Price"
+        tier = 'near'
+    return _format_deal_message(tier, round(abs(deal_percent), 1))
+
 
+@functools.lru_cache(maxsize=256)
+def _format_deal_message(tier: str, shown_percent: float) -> str:
+    """Cached implementation of format_deal_message."""
+    return DEAL_MESSAGES[tier].format(shown_percent)
 
-def send_discord_notification(listing: Dict) -> None:
-    """Send a Discord notification for a new marketplace listing.
+
+def build_embed(listing: Dict) -> Optional[Dict]:
+    """Build a Discord embed for a new marketplace listing.
     
     Args:
         listing: Dictionary containing listing information.
+        
+    Returns:
+        Embed dictionary, or None if the listing is filtered out.
     """
-    if not DISCORD_MARKETPLACE_WEBHOOK_URL:
-        logging.warning("Discord webhook URL not configured")
-        return
+    # Extract listing data - adapt these fields based on actual data structure
+    card_name = listing.get('card_name', 'Unknown Card')
+    set_name = listing.get('set_name', 'Unknown Set')
+    listed_price = float(listing.get('listed_price', 0))
+    market_price = float(listing.get('market_price', 0))
+    quantity = listing.get('quantity', 1)
+    card_id = listing.get('card_id', '')
+    rarity = listing.get('rarity', 'Common')
+    
+    # Calculate deal percentage
+    deal_percent = calculate_deal_percentage(listed_price, market_price)
+    
+    # Skip notification if deal doesn't meet threshold
+    if DEAL_THRESHOLD_PERCENT > 0 and deal_percent > -DEAL_THRESHOLD_PERCENT:
+        return None
+    
+    # Skip if outside price range
+    if MIN_LISTING_PRICE > 0 and listed_price < MIN_LISTING_PRICE:
+        return None
+    if MAX_LISTING_PRICE > 0 and listed_price > MAX_LISTING_PRICE:
+        return None
+    
+    # Build card URL using the correct rip.fun format
+    card_url = f"https://rip.fun/card/{card_id}" if card_id else "https://rip.fun/marketplace"
+    
+    # Format prices
+    listed_price_str = f"${listed_price:.2f}"
+    market_price_str = f"${market_price:.2f}" if market_price > 0 else "N/A"
+    
+    # Build Discord embed
+    embed_color = 0x00ff00 if deal_percent < -10 else 0xffaa00 if deal_percent < 0 else 0xff6600
+    
+    deal_message = format_deal_message(deal_percent) if market_price > 0 else ""
+    
+    rarity_emoji = RARITY_EMOJI.get(rarity, '💎')
+    
+    description = f"🏷️ Listed: {listed_price_str}\n"
+    
+    if market_price > 0:
+        description += f"📈 Market: {market_price_str}\n"
+        if deal_message:
+            description += f"{deal_message}\n"
+    
+    description += f"📦 Quantity: {quantity}\n"
+    description += f"⏰ Detected: {datetime.now().strftime('%H:%M:%S')}"
+    
+    return {
+        "title": f"{rarity_emoji} {card_name} ({set_name})",
+        "url": card_url,
+        "description": description,
+        "color": embed_color,
+    }
+
+
+async def post_discord_embeds(session: aiohttp.ClientSession, embeds: List[Dict]) -> None:
+    """Post one message of up to DISCORD_MAX_EMBEDS embeds to Discord.
+    
+    Args:
+        session: Shared aiohttp session for webhook requests.
+        embeds: List of embed dictionaries built by build_embed.
+    """
+    payload = orjson.dumps({"content": "🆕 **NEW CARD LISTINGS!**", "embeds": embeds})
     
     try:
-        # Extract listing data - adapt these fields based on actual data structure
-        card_name = listing.get('card_name', 'Unknown Card')
-        set_name = listing.get('set_name', 'Unknown Set')
-        listed_price = float(listing.get('listed_price', 0))
-        market_price = float(listing.get('market_price', 0))
-        quantity = listing.get('quantity', 1)
-        card_id = listing.get('card_id', '')
-        rarity = listing.get('rarity', 'Common')
-        
-        # Calculate deal percentage
-        deal_percent = calculate_deal_percentage(listed_price, market_price)
-        
-        # Skip notification if deal doesn't meet threshold
-        if DEAL_THRESHOLD_PERCENT > 0 and deal_percent > -DEAL_THRESHOLD_PERCENT:
-            return
-        
-        # Skip if outside price range
-        if MIN_LISTING_PRICE > 0 and listed_price < MIN_LISTING_PRICE:
-            return
-        if MAX_LISTING_PRICE > 0 and listed_price > MAX_LISTING_PRICE:
-            return
-        
-        # Build card URL using the correct rip.fun format
-        card_url = f"https://rip.fun/card/{card_id}" if card_id else "https://rip.fun/marketplace"
-        
-        # Format prices
-        listed_price_str = f"${listed_price:.2f}"
-        market_price_str = f"${market_price:.2f}" if market_price > 0 else "N/A"
-        
-        # Build Discord message
-        embed_color = 0x00ff00 if deal_percent < -10 else 0xffaa00 if deal_percent < 0 else 0xff6600
-        
-        deal_message = format_deal_message(deal_percent) if market_price > 0 else ""
-        
-        # Rarity emoji mapping
-        rarity_emoji = {
-            'Common': '⚪',
-            'Uncommon': '🟢',
-            'Rare': '🔵',
-            'Rare Holo': '🟣',
-            'Ultra Rare': '🟠',
-            'Secret Rare': '🟡',
-            'Rainbow Rare': '🌈'
-        }.get(rarity, '💎')
-        
-        message_content = f"🆕 **NEW CARD LISTING!**\n"
-        message_content += f"{rarity_emoji} **{card_name}** ({set_name})\n"
-        message_content += f"🏷️ Listed: {listed_price_str}\n"
-        
-        if market_price > 0:
-            message_content += f"📈 Market: {market_price_str}\n"
-            if deal_message:
-                message_content += f"{deal_message}\n"
-        
-        message_content += f"📦 Quantity: {quantity}\n"
-        message_content += f"🔗 {card_url}\n"
-        message_content += f"⏰ Detected: {datetime.now().strftime('%H:%M:%S')}"
-        
-        payload = {"content": message_content}
-        
-        response = requests.post(DISCORD_MARKETPLACE_WEBHOOK_URL, json=payload, timeout=10)
-        response.raise_for_status()
-        
-        logging.info("Sent Discord notification for %s", card_name)
+        for attempt in range(2):
+            async with session.post(DISCORD_MARKETPLACE_WEBHOOK_URL, data=payload, headers=JSON_HEADERS) as response:
+                # Honor Discord's rate limit once before giving up on this message
+                if response.status == 429 and attempt == 0:
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                    logging.warning("Discord rate limited, retrying in %.1f seconds", retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue
+                
+                response.raise_for_status()
+                logging.info("Sent Discord notification with %d listing(s)", len(embeds))
+                return
         
     except Exception as exc:
         logging.error("Failed to send Discord notification: %s", exc)
 
 
-def process_new_listings(listings: List[Dict], seen_listings: Set[str]) -> Set[str]:
+async def discord_sender(notify_queue: "asyncio.Queue[List[Dict]]") -> None:
+    """Drain queued embed batches to Discord over one pooled aiohttp session.
+    
+    Args:
+        notify_queue: Queue of embed batches produced by the polling loop.
+    """
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=75)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        while True:
+            embeds = await notify_queue.get()
+            try:
+                await post_discord_embeds(session, embeds)
+            finally:
+                notify_queue.task_done()
+
+
+def enqueue_embeds(notify_queue: "asyncio.Queue[List[Dict]]", embeds: List[Dict]) -> None:
+    """Queue embeds for sending, split into messages of DISCORD_MAX_EMBEDS.
+    
+    Must run on the event loop thread. Batches are dropped with a warning if
+    the queue is full, so an outage can't grow memory without bound.
+    
+    Args:
+        notify_queue: Queue consumed by discord_sender.
+        embeds: List of embed dictionaries built by build_embed.
+    """
+    for i in range(0, len(embeds), DISCORD_MAX_EMBEDS):
+        chunk = embeds[i:i + DISCORD_MAX_EMBEDS]
+        try:
+            notify_queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            logging.warning("Notification queue full, dropping %d listing(s)", len(chunk))
+
+
+def process_new_listings(
+    listings: List[Dict],
+    seen_listings: "OrderedDict[str, None]",
+    notify: Callable[[List[Dict]], None],
+) -> int:
     """Process marketplace listings and send notifications for new ones.
     
+    The seen listings are updated in place.
+    
     Args:
         listings: List of marketplace listings.
-        seen_listings: Set of previously seen listing IDs.
+        seen_listings: Ordered mapping of previously seen listing IDs.
+        notify: Called with the embeds for new listings.
         
     Returns:
-        Updated set of seen listing IDs.
+        Number of new listings found.
     """
-    new_seen = seen_listings.copy()
     new_listings_count = 0
+    embeds = []
     
     for listing in listings:
-        # Create a unique ID for this listing - adapt based on actual data structure
-        listing_id = f"{listing.get('card_id', 'unknown')}_{listing.get('timestamp', time.time())}"
+        # Card and price identify a listing across polls
+        listing_id = f"{listing.get('card_id', 'unknown')}::{listing.get('listed_price')}"
         
         if listing_id not in seen_listings:
             new_listings_count += 1
-            send_discord_notification(listing)
-            new_seen.add(listing_id)
+            embed = build_embed(listing)
+            if embed:
+                embeds.append(embed)
+        
+        # Refresh listings still on the page so they aren't evicted
+        mark_seen(seen_listings, listing_id)
+    
+    if embeds:
+        notify(embeds)
     
     if new_listings_count > 0:
         logging.info("Found %d new listings", new_listings_count)
     else:
         logging.info("No new listings found")
     
-    return new_seen
+    return new_listings_count
 
 
-def check_marketplace() -> None:
-    """Check the marketplace for new listings and send notifications."""
+def check_marketplace(notify: Callable[[List[Dict]], None]) -> bool:
+    """Check the marketplace for new listings and send notifications.
+    
+    Args:
+        notify: Called with the embeds for new listings.
+        
+    Returns:
+        False if the marketplace could not be fetched, True otherwise.
+    """
     logging.info("Checking marketplace for new listings...")
     
-    # Load previously seen listings
+    # Load previously seen listings (cached after the first call)
     seen_listings = load_seen_listings()
     
     # Fetch current marketplace data
@@ -330,19 +641,46 @@ def check_marketplace() -> None:
     
     if not marketplace_data:
         logging.warning("No marketplace data available")
-        return
+        return False
     
     listings = marketplace_data.get('listings', [])
     
     if not listings:
         logging.warning("No listings found in marketplace data")
-        return
+        return True
     
     # Process new listings
-    updated_seen = process_new_listings(listings, seen_listings)
+    new_listings_count = process_new_listings(listings, seen_listings, notify)
     
-    # Save updated seen listings
-    save_seen_listings(updated_seen)
+    # Save updated seen listings only if new ones were added
+    if new_listings_count > 0:
+        save_seen_listings(seen_listings)
+    
+    return True
+
+
+async def run_monitor() -> None:
+    """Poll the marketplace while a background task sends notifications.
+    
+    Each check runs in a worker thread so the blocking scrape never holds up
+    webhook delivery, and new embeds are handed back to the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    notify_queue: "asyncio.Queue[List[Dict]]" = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+    sender = asyncio.create_task(discord_sender(notify_queue))
+    
+    def notify(embeds: List[Dict]) -> None:
+        loop.call_soon_threadsafe(enqueue_embeds, notify_queue, embeds)
+    
+    try:
+        await poll_forever(
+            "Marketplace",
+            functools.partial(check_marketplace, notify),
+            POLL_INTERVAL_SECONDS,
+            MAX_BACKOFF_SECONDS,
+        )
+    finally:
+        sender.cancel()
 
 
 def main() -> None:
@@ -370,12 +708,10 @@ def main() -> None:
         logging.info("Only notifying about deals >= %.1f%% below market", DEAL_THRESHOLD_PERCENT)
     
     try:
-        while True:
-            check_marketplace()
-            time.sleep(POLL_INTERVAL_SECONDS)
+        asyncio.run(run_monitor())
     except KeyboardInterrupt:
         logging.info("Marketplace monitor stopped by user")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
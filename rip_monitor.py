@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Rip.fun Combined Monitor
+========================
+
+This script runs the store stock notifier and the marketplace activity
+monitor in one process, so both share the single HTTP connection pool in
+rip_http.py instead of each process keeping its own.
+
+How it works
+------------
+
+Both checks run on one asyncio event loop, each in its own polling task.
+The blocking scrapers run one at a time on a single worker thread, so the
+shared requests session is never used concurrently. Marketplace notifications
+are sent by a background task, exactly as in rip_marketplace_monitor.py.
+The marketplace task starts MARKETPLACE_OFFSET_SECONDS after the store task
+so the two don't hit rip.fun at the same moment.
+
+Configuration
+-------------
+
+Each check keeps its own settings (webhook URLs, poll intervals, filters)
+in rip_stock_notifier.py and rip_marketplace_monitor.py.
+
+Running
+-------
+
+python3 rip_monitor.py, then use Ctrl+C to stop.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import rip_marketplace_monitor as marketplace
+import rip_stock_notifier as stock
+from rip_http import poll_forever
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Delay before the first marketplace check, staggering it from the store check
+MARKETPLACE_OFFSET_SECONDS: int = 30
+
+# ---------------------------------------------------------------------------
+# Core Functions
+# ---------------------------------------------------------------------------
+
+async def run_all() -> None:
+    """Run the store and marketplace checks side by side."""
+    loop = asyncio.get_running_loop()
+    notify_queue: "asyncio.Queue[List[Dict]]" = asyncio.Queue(maxsize=marketplace.NOTIFY_QUEUE_SIZE)
+    sender = asyncio.create_task(marketplace.discord_sender(notify_queue))
+
+    # One worker keeps the checks from using the shared session at once
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def notify(embeds: List[Dict]) -> None:
+        loop.call_soon_threadsafe(marketplace.enqueue_embeds, notify_queue, embeds)
+
+    try:
+        await asyncio.gather(
+            poll_forever(
+                "Store",
+                stock.check_and_notify,
+                stock.POLL_INTERVAL_SECONDS,
+                stock.MAX_BACKOFF_SECONDS,
+                executor=executor,
+            ),
+            poll_forever(
+                "Marketplace",
+                functools.partial(marketplace.check_marketplace, notify),
+                marketplace.POLL_INTERVAL_SECONDS,
+                marketplace.MAX_BACKOFF_SECONDS,
+                start_delay=MARKETPLACE_OFFSET_SECONDS,
+                executor=executor,
+            ),
+        )
+    finally:
+        sender.cancel()
+        executor.shutdown(wait=False)
+
+
+def main() -> None:
+    """Main entry point - runs both monitors until interrupted."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
+    logging.info("Starting Rip.fun combined monitor")
+    logging.info("Checking store every %d seconds", stock.POLL_INTERVAL_SECONDS)
+    logging.info(
+        "Checking marketplace every %d seconds, starting after %d seconds",
+        marketplace.POLL_INTERVAL_SECONDS,
+        MARKETPLACE_OFFSET_SECONDS,
+    )
+
+    if not stock.DISCORD_WEBHOOK_URL:
+        logging.warning("DISCORD_WEBHOOK_URL not set, store alerts won't be sent to Discord")
+
+    if not marketplace.DISCORD_MARKETPLACE_WEBHOOK_URL:
+        logging.error("DISCORD_MARKETPLACE_WEBHOOK_URL environment variable not set")
+        return
+
+    try:
+        asyncio.run(run_all())
+    except KeyboardInterrupt:
+        logging.info("Monitor stopped by user")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,13 +31,23 @@ The script runs continuously, checking every 4 minutes. Use Ctrl+C to stop.
 For testing: python3 rip_stock_notifier.py --test
 """
 
-import json
+import asyncio
 import os
-import time
 import logging
 import re
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Optional
+import orjson
 import requests
+from rip_http import (
+    FETCH_TIMEOUT,
+    JSON_HEADERS,
+    SESSION,
+    STREAM_CHUNK_SIZE,
+    poll_forever,
+    remember_validators,
+    revalidation_headers,
+)
+from rip_sveltekit import fetch_data_endpoint, iter_objects
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -50,6 +60,9 @@ DISCORD_WEBHOOK_URL: str = os.getenv("DISCORD_WEBHOOK_URL", "")
 # How often to check for new stock (in seconds). 240 seconds = 4 minutes.
 POLL_INTERVAL_SECONDS: int = 240
 
+# Upper bound for the poll interval while backing off after failed checks
+MAX_BACKOFF_SECONDS: int = 3600
+
 # Enable Discord notifications
 ENABLE_DISCORD_NOTIFICATIONS: bool = True
 
@@ -66,42 +79,161 @@ EMAIL_CONFIG = {
     "to_address": "recipient@example.com",
 }
 
+# SvelteKit data endpoint serving the store page data as JSON
+STORE_DATA_URL: str = "https://rip.fun/store/__data.json"
+
+# Start of SvelteKit's inline hydration script, which carries the page data
+SVELTEKIT_DATA_MARKER: bytes = b"__sveltekit_"
+
+# Actual inventory packs: objects with token_id AND name together.
+# This avoids the featured sets which don't have token_id.
+INVENTORY_RE = re.compile(rb'token_id:"(\d+)"[^}]*?name:"([^"]+Booster Pack[^"]*)"', re.DOTALL)
+
+# Literal prefix of INVENTORY_RE, located with bytes.find so the regex only
+# runs where a match can start
+INVENTORY_ANCHOR: bytes = b'token_id:"'
+
 # ---------------------------------------------------------------------------
 # Core Functions
 # ---------------------------------------------------------------------------
 
-def fetch_available_packs_from_store() -> Dict[str, int]:
+def read_until_sveltekit_data(response: requests.Response) -> bytearray:
+    """Read a streamed page up to the end of the SvelteKit hydration script.
+
+    The inventory data lives in the inline script that boots SvelteKit, so
+    nothing after its closing tag is needed. If the marker never appears the
+    whole page is read.
+    """
+    body = bytearray()
+    search_from = 0
+    data_start = -1
+
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        body += chunk
+
+        # Re-check the tail of the previous chunk in case a marker was split
+        if data_start < 0:
+            data_start = body.find(SVELTEKIT_DATA_MARKER, search_from)
+            search_from = max(0, len(body) - len(SVELTEKIT_DATA_MARKER))
+            if data_start < 0:
+                continue
+            search_from = data_start
+
+        script_end = body.find(b"</script>", search_from)
+        if script_end >= 0:
+            del body[script_end:]
+            break
+        search_from = max(data_start, len(body) - len(b"</script>"))
+
+    return body
+
+
+def find_inventory_pack_names(html: bytes) -> List[str]:
+    """Return the names of actual inventory packs (not featured sets) in a page.
+
+    Jumps between occurrences of INVENTORY_ANCHOR and only runs
+    INVENTORY_RE there, decoding just the captured names.
+    """
+    pack_names = []
+    i = html.find(INVENTORY_ANCHOR)
+    while i >= 0:
+        m = INVENTORY_RE.match(html, i)
+        if m:
+            pack_names.append(m.group(2).decode("utf-8", "replace"))
+            i = m.end()
+        else:
+            i += len(INVENTORY_ANCHOR)
+        i = html.find(INVENTORY_ANCHOR, i)
+    return pack_names
+
+
+def count_packs_by_set(pack_names: Iterable[str]) -> Dict[str, int]:
+    """Count packs per set from names like "Surging Sparks Booster Pack"."""
+    pack_counts: Dict[str, int] = {}
+    for pack_name in pack_names:
+        set_name = pack_name.replace(" Booster Pack", "").strip()
+        pack_counts[set_name] = pack_counts.get(set_name, 0) + 1
+    return pack_counts
+
+
+# Parsed result from the last full store fetch
+_last_pack_counts: Optional[Dict[str, int]] = None
+
+
+def extract_pack_counts(nodes: List[Any]) -> Dict[str, int]:
+    """Count available packs in the decoded store __data.json nodes.
+
+    Returns a dictionary mapping set names to pack counts, empty when
+    nothing is in stock.
+    """
+    # Same rule as INVENTORY_RE: real inventory has a token_id
+    pack_names = [
+        obj["name"]
+        for obj in iter_objects(nodes)
+        if "token_id" in obj
+        and isinstance(obj.get("name"), str)
+        and "Booster Pack" in obj["name"]
+    ]
+    return count_packs_by_set(pack_names)
+
+
+def fetch_available_packs_from_store() -> Optional[Dict[str, int]]:
     """Scrape the store page to find available packs by set.
 
-    Returns a dictionary mapping set names to pack counts.
+    Returns a dictionary mapping set names to pack counts, or None if the
+    page could not be fetched.
     Only includes actual inventory (packs with token_id), not featured sets.
+    The structured __data.json endpoint is tried first (see
+    rip_sveltekit.fetch_data_endpoint); if it is unusable, the HTML page is
+    scraped and revalidated the same way when a previous result is cached.
     """
+    global _last_pack_counts
+
+    try:
+        pack_counts = fetch_data_endpoint(STORE_DATA_URL, extract_pack_counts)
+    except requests.RequestException as exc:
+        logging.error("Failed to fetch store data endpoint: %s", exc)
+        return None
+    except Exception as exc:
+        logging.error("Error parsing store data endpoint: %s", exc)
+        return None
+
+    if pack_counts is not None:
+        logging.info("Found packs in store: %s", pack_counts)
+        _last_pack_counts = pack_counts
+        return pack_counts
+
     url = "https://rip.fun/store"
+    headers = {}
+    if _last_pack_counts is not None:
+        headers = revalidation_headers(url)
+        if headers is None:
+            logging.info("Store page unchanged since last fetch, reusing last result")
+            return _last_pack_counts
+
     try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
+        # Stream the page and stop once the SvelteKit data script has been read
+        with SESSION.get(url, headers=headers, stream=True, timeout=FETCH_TIMEOUT) as response:
+            if response.status_code == 304:
+                logging.info("Store page not modified, reusing last result")
+                return _last_pack_counts
+
+            response.raise_for_status()
+            html = read_until_sveltekit_data(response)
         
-        html = response.text
-        logging.debug("Fetched store page (%d characters)", len(html))
+        logging.debug("Fetched store page (%d bytes)", len(html))
         
-        # Look for actual inventory packs (not featured sets)
-        # Pattern: Look for objects with token_id AND name together (real inventory)
-        # This avoids the featured sets which don't have token_id
-        inventory_pattern = r'token_id:"(\d+)"[^}]*?name:"([^"]+Booster Pack[^"]*)"'
-        inventory_matches = re.findall(inventory_pattern, html, re.DOTALL)
-        
-        # Count packs by set name
-        pack_counts = {}
-        for token_id, pack_name in inventory_matches:
-            set_name = pack_name.replace(" Booster Pack", "").strip()
-            pack_counts[set_name] = pack_counts.get(set_name, 0) + 1
+        # Count actual inventory packs (not featured sets) by set name
+        pack_counts = count_packs_by_set(find_inventory_pack_names(html))
         
         logging.info("Found packs in store: %s", pack_counts)
+        remember_validators(url, response)
+        _last_pack_counts = pack_counts
         return pack_counts
         
     except requests.RequestException as exc:
         logging.error("Failed to fetch store page: %s", exc)
-        return {}
+        return None
     except Exception as exc:
         logging.error("Error parsing store data: %s", exc)
         return {}
@@ -117,8 +249,8 @@ def send_discord_notification(message: str) -> None:
         return
     
     try:
-        payload = {"content": message}
-        resp = requests.post(DISCORD_WEBHOOK_URL, json=payload, timeout=10)
+        payload = orjson.dumps({"content": message})
+        resp = SESSION.post(DISCORD_WEBHOOK_URL, data=payload, headers=JSON_HEADERS, timeout=10)
         resp.raise_for_status()
         logging.info("Sent Discord notification")
     except Exception as exc:
@@ -148,14 +280,20 @@ def send_email(subject: str, body: str) -> None:
         logging.error("Failed to send email notification: %s", exc)
 
 
-def check_and_notify() -> None:
-    """Check the store for available packs and send notifications."""
+def check_and_notify() -> bool:
+    """Check the store for available packs and send notifications.
+
+    Returns False if the store page could not be fetched, True otherwise.
+    """
     # Get current pack availability from store page
     available_packs = fetch_available_packs_from_store()
     
+    if available_packs is None:
+        return False
+    
     if not available_packs:
-        logging.info("No packs found in store (or failed to fetch)")
-        return
+        logging.info("No packs found in store")
+        return True
     
     total_packs = 0
     
@@ -170,6 +308,7 @@ def check_and_notify() -> None:
     # Log summary
     set_count = len(available_packs)
     logging.info("Found %d sets with %d total packs in stock", set_count, total_packs)
+    return True
 
 
 
@@ -190,9 +329,7 @@ def main() -> None:
         logging.info("Discord notifications disabled")
 
     try:
-        while True:
-            check_and_notify()
-            time.sleep(POLL_INTERVAL_SECONDS)
+        asyncio.run(poll_forever("Store", check_and_notify, POLL_INTERVAL_SECONDS, MAX_BACKOFF_SECONDS))
     except KeyboardInterrupt:
         logging.info("Notifier stopped by user")
 
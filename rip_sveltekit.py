@@ -0,0 +1,196 @@
+"""
+SvelteKit Data Helpers
+======================
+
+Rip.fun is a SvelteKit app, so the data behind each page is also served as
+JSON at ``<page>/__data.json``. That payload is serialized with devalue:
+each node's ``data`` is a flat array in which objects and arrays hold
+indices into the same array instead of values. These helpers decode it back
+into plain Python objects so the scrapers can read fields directly instead
+of pattern matching rendered HTML.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+import orjson
+import requests
+from rip_http import FETCH_TIMEOUT, SESSION, remember_validators, revalidation_headers
+
+T = TypeVar("T")
+
+# Negative indices devalue uses for values plain JSON can't represent
+SPECIAL_VALUES: Dict[int, Any] = {
+    -1: None,            # undefined
+    -2: None,            # array hole
+    -3: float("nan"),
+    -4: float("inf"),
+    -5: float("-inf"),
+    -6: -0.0,
+}
+
+
+def unflatten(data: List[Any]) -> Any:
+    """Rebuild the value described by a devalue flat array.
+
+    Args:
+        data: The ``data`` array of one __data.json node.
+
+    Returns:
+        The decoded root value.
+    """
+    hydrated: Dict[int, Any] = {}
+
+    def hydrate(index: int) -> Any:
+        if index in SPECIAL_VALUES:
+            return SPECIAL_VALUES[index]
+        if index in hydrated:
+            return hydrated[index]
+
+        value = data[index]
+        if isinstance(value, dict):
+            result: Any = {}
+            hydrated[index] = result
+            for key, child in value.items():
+                result[key] = hydrate(child)
+        elif isinstance(value, list) and value and isinstance(value[0], str):
+            # Tagged values such as ["Date", "..."] or ["Map", k, v, ...]
+            tag = value[0]
+            if tag in ("Map", "null"):
+                result = {}
+                hydrated[index] = result
+                for i in range(1, len(value) - 1, 2):
+                    key = hydrate(value[i]) if tag == "Map" else value[i]
+                    result[key] = hydrate(value[i + 1])
+            elif tag == "Set":
+                result = []
+                hydrated[index] = result
+                result.extend(hydrate(child) for child in value[1:])
+            else:
+                # Date, BigInt, RegExp, ... keep their raw string payload
+                result = value[1] if len(value) == 2 else value[1:]
+        elif isinstance(value, list):
+            result = []
+            hydrated[index] = result
+            result.extend(hydrate(child) for child in value)
+        else:
+            result = value
+
+        hydrated[index] = result
+        return result
+
+    return hydrate(0)
+
+
+def load_data_nodes(raw: bytes) -> List[Any]:
+    """Decode a __data.json response body into one value per data node.
+
+    Args:
+        raw: Response body.
+
+    Returns:
+        Decoded data of every node that carries data, outermost layout first.
+
+    Raises:
+        ValueError: If the body is not a SvelteKit data payload.
+    """
+    payload = orjson.loads(raw)
+    if not isinstance(payload, dict) or payload.get("type") != "data":
+        raise ValueError("not a SvelteKit data payload")
+
+    return [
+        unflatten(node["data"])
+        for node in payload.get("nodes", [])
+        if isinstance(node, dict) and node.get("type") == "data"
+    ]
+
+
+def iter_objects(value: Any) -> Iterator[Dict]:
+    """Yield every dictionary nested in a decoded value, in document order.
+
+    Args:
+        value: Decoded value, such as the result of load_data_nodes.
+    """
+    stack = [value]
+    visited = set()
+
+    while stack:
+        current = stack.pop()
+        if isinstance(current, (dict, list)):
+            # devalue can encode shared and cyclic references
+            if id(current) in visited:
+                continue
+            visited.add(id(current))
+
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+# Whether each __data.json endpoint works: missing until it has been probed,
+# True once it returned a valid payload, False if it is missing or unusable
+_endpoint_ok: Dict[str, bool] = {}
+
+# Extracted result from the last full fetch of each confirmed endpoint
+_endpoint_results: Dict[str, Any] = {}
+
+
+def fetch_data_endpoint(url: str, extract: Callable[[List[Any]], T]) -> Optional[T]:
+    """Fetch a __data.json endpoint and extract a result from its data nodes.
+
+    The endpoint is confirmed by its first valid payload. Until then a 404,
+    410 or undecodable payload marks it unusable for good and None is
+    returned, so the caller scrapes the HTML page instead. Once confirmed,
+    the last result is revalidated (see rip_http.revalidation_headers) and
+    reused if the data is unchanged, and a bad response is only a failed
+    check: the endpoint is never dropped because of one.
+
+    Args:
+        url: URL of the __data.json endpoint.
+        extract: Builds the result from the decoded data nodes.
+
+    Returns:
+        The extracted result, or None if the endpoint is unusable.
+
+    Raises:
+        requests.RequestException: If the request fails or is refused.
+        Exception: Whatever decoding or extract raised, once confirmed.
+    """
+    confirmed = _endpoint_ok.get(url)
+    if confirmed is False:
+        return None
+
+    headers = {"Accept": "application/json"}
+    if confirmed and url in _endpoint_results:
+        validators = revalidation_headers(url)
+        if validators is None:
+            return _endpoint_results[url]
+        headers.update(validators)
+
+    response = SESSION.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    if response.status_code == 304 and url in _endpoint_results:
+        return _endpoint_results[url]
+    if response.status_code in (404, 410) and not confirmed:
+        logging.info("%s not found, scraping HTML instead", url)
+        _endpoint_ok[url] = False
+        return None
+    # Rate limits, bot challenges and server errors fail this check only
+    response.raise_for_status()
+
+    try:
+        nodes = load_data_nodes(response.content)
+        if not nodes:
+            raise ValueError("no page data")
+        result = extract(nodes)
+    except Exception as exc:
+        if confirmed:
+            raise
+        logging.warning("Could not decode %s, scraping HTML instead: %s", url, exc)
+        _endpoint_ok[url] = False
+        return None
+
+    _endpoint_ok[url] = True
+    _endpoint_results[url] = result
+    remember_validators(url, response)
+    return result